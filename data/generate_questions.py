@@ -1,12 +1,69 @@
 """
 Generate 200 quiz questions for complexity analysis
 Mix of code snippets and algorithm names
-"""
 
-import json
+Dev-time tool only: the resulting quiz_bank.json is committed and served
+as-is, so this script never runs on the server.
+"""
 
-questions = []
-question_id = 1
+import itertools
+import os
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+# Fastest available encoder; msgspec and orjson both serialize dataclasses natively
+try:
+    from msgspec.json import Encoder
+
+    dumps = Encoder().encode
+except ImportError:  # msgspec is optional; try orjson, then the stdlib encoder
+    try:
+        from orjson import dumps
+    except ImportError:
+        import json
+
+        def dumps(obj):
+            return json.dumps(obj, default=asdict, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+
+# === Merge sort, quick sort, power set and permutation snippets ===
+MERGE_SORT = """\
+def merge_sort(arr):
+    if len(arr) <= 1:
+        return arr
+    mid = len(arr) // 2
+    left = merge_sort(arr[:mid])
+    right = merge_sort(arr[mid:])
+    return merge(left, right)"""
+
+QUICK_SORT = """\
+def quick_sort(arr):
+    if len(arr) <= 1:
+        return arr
+    pivot = arr[len(arr)//2]
+    left = [x for x in arr if x < pivot]
+    middle = [x for x in arr if x == pivot]
+    right = [x for x in arr if x > pivot]
+    return quick_sort(left) + middle + quick_sort(right)"""
+
+POWER_SET = """\
+def power_set(arr):
+    if len(arr) == 0:
+        return [[]]
+    elem = arr[0]
+    rest = power_set(arr[1:])
+    return rest + [subset + [elem] for subset in rest]"""
+
+PERMUTATIONS = """\
+def permutations(arr):
+    if len(arr) <= 1:
+        return [arr]
+    result = []
+    for i in range(len(arr)):
+        rest = arr[:i] + arr[i+1:]
+        for perm in permutations(rest):
+            result.append([arr[i]] + perm)
+    return result"""
 
 # === O(1) Constant Time Questions ===
 o1_code_snippets = [
@@ -25,41 +82,13 @@ o1_algorithms = [
     ("Checking if number is even", "Single modulo operation is O(1)."),
 ]
 
-# Add O(1) code questions
-for code, explanation in o1_code_snippets:
-    questions.append({
-        "id": question_id,
-        "type": "code",
-        "language": "python",
-        "prompt": code,
-        "correct_complexity": "O(1)",
-        "explanation": explanation,
-        "difficulty": "easy",
-        "highlight_spans": []
-    })
-    question_id += 1
-
-# Add O(1) algorithm name questions
-for alg, explanation in o1_algorithms:
-    questions.append({
-        "id": question_id,
-        "type": "name",
-        "language": None,
-        "prompt": alg,
-        "correct_complexity": "O(1)",
-        "explanation": explanation,
-        "difficulty": "easy",
-        "highlight_spans": []
-    })
-    question_id += 1
-
 # === O(log n) Logarithmic Questions ===
 ologn_code_snippets = [
-    ("def binary_search(arr, target):\n    left, right = 0, len(arr)-1\n    while left <= right:\n        mid = (left + right) // 2\n        if arr[mid] == target:\n            return mid\n        elif arr[mid] < target:\n            left = mid + 1\n        else:\n            right = mid - 1\n    return -1", "Binary search halves search space each iteration → O(log n)."),
-    ("def count_bits(n):\n    count = 0\n    while n > 0:\n        n //= 2\n        count += 1\n    return count", "Dividing by 2 each iteration → O(log n)."),
-    ("def power_of_two(n):\n    count = 0\n    i = 1\n    while i <= n:\n        i *= 2\n        count += 1\n    return count", "Multiplying by 2 each iteration → O(log n)."),
-    ("for(int i = 1; i <= n; i *= 2) {\n    cout << i << endl;\n}", "Loop with i *= 2 runs log₂(n) times."),
-    ("while(n > 1) {\n    n /= 2;\n}", "Division by 2 pattern → O(log n)."),
+    ("def binary_search(arr, target):\n    left, right = 0, len(arr)-1\n    while left <= right:\n        mid = (left + right) // 2\n        if arr[mid] == target:\n            return mid\n        elif arr[mid] < target:\n            left = mid + 1\n        else:\n            right = mid - 1\n    return -1", "Binary search halves search space each iteration → O(log n).", "python"),
+    ("def count_bits(n):\n    count = 0\n    while n > 0:\n        n //= 2\n        count += 1\n    return count", "Dividing by 2 each iteration → O(log n).", "python"),
+    ("def power_of_two(n):\n    count = 0\n    i = 1\n    while i <= n:\n        i *= 2\n        count += 1\n    return count", "Multiplying by 2 each iteration → O(log n).", "python"),
+    ("for(int i = 1; i <= n; i *= 2) {\n    cout << i << endl;\n}", "Loop with i *= 2 runs log₂(n) times.", "cpp"),
+    ("while(n > 1) {\n    n /= 2;\n}", "Division by 2 pattern → O(log n).", "python"),
 ]
 
 ologn_algorithms = [
@@ -70,33 +99,6 @@ ologn_algorithms = [
     ("Interpolation Search (average)", "Improves on binary search for uniform data → O(log log n) average, but O(log n) typical."),
 ]
 
-for code, explanation in ologn_code_snippets:
-    lang = "cpp" if "cout" in code or "int i" in code else "python"
-    questions.append({
-        "id": question_id,
-        "type": "code",
-        "language": lang,
-        "prompt": code,
-        "correct_complexity": "O(log n)",
-        "explanation": explanation,
-        "difficulty": "easy" if question_id % 2 == 0 else "medium",
-        "highlight_spans": []
-    })
-    question_id += 1
-
-for alg, explanation in ologn_algorithms:
-    questions.append({
-        "id": question_id,
-        "type": "name",
-        "language": None,
-        "prompt": alg,
-        "correct_complexity": "O(log n)",
-        "explanation": explanation,
-        "difficulty": "easy",
-        "highlight_spans": []
-    })
-    question_id += 1
-
 # === O(n) Linear Questions ===
 on_code_snippets = [
     ("def sum_array(arr):\n    total = 0\n    for num in arr:\n        total += num\n    return total", "Single loop through n elements → O(n)."),
@@ -116,36 +118,10 @@ on_algorithms = [
     ("Linked list traversal", "Following n pointers → O(n)."),
 ]
 
-for code, explanation in on_code_snippets:
-    questions.append({
-        "id": question_id,
-        "type": "code",
-        "language": "python",
-        "prompt": code,
-        "correct_complexity": "O(n)",
-        "explanation": explanation,
-        "difficulty": "easy",
-        "highlight_spans": []
-    })
-    question_id += 1
-
-for alg, explanation in on_algorithms:
-    questions.append({
-        "id": question_id,
-        "type": "name",
-        "language": None,
-        "prompt": alg,
-        "correct_complexity": "O(n)",
-        "explanation": explanation,
-        "difficulty": "easy",
-        "highlight_spans": []
-    })
-    question_id += 1
-
 # === O(n log n) Questions ===
 onlogn_code_snippets = [
-    ("def merge_sort(arr):\n    if len(arr) <= 1:\n        return arr\n    mid = len(arr) // 2\n    left = merge_sort(arr[:mid])\n    right = merge_sort(arr[mid:])\n    return merge(left, right)", "Divides in half (log n levels) and merges (n work per level) → O(n log n)."),
-    ("def quick_sort(arr):\n    if len(arr) <= 1:\n        return arr\n    pivot = arr[len(arr)//2]\n    left = [x for x in arr if x < pivot]\n    middle = [x for x in arr if x == pivot]\n    right = [x for x in arr if x > pivot]\n    return quick_sort(left) + middle + quick_sort(right)", "Average case partitions log n times with n work each → O(n log n)."),
+    (MERGE_SORT, "Divides in half (log n levels) and merges (n work per level) → O(n log n)."),
+    (QUICK_SORT, "Average case partitions log n times with n work each → O(n log n)."),
     ("arr.sort()", "Python's Timsort is O(n log n)."),
     ("sorted_arr = sorted(arr)", "Built-in sorted() uses O(n log n) algorithm."),
 ]
@@ -158,39 +134,13 @@ onlogn_algorithms = [
     ("Sorting using comparison-based algorithm", "Lower bound for comparison sorts is O(n log n)."),
 ]
 
-for code, explanation in onlogn_code_snippets:
-    questions.append({
-        "id": question_id,
-        "type": "code",
-        "language": "python",
-        "prompt": code,
-        "correct_complexity": "O(n log n)",
-        "explanation": explanation,
-        "difficulty": "medium",
-        "highlight_spans": []
-    })
-    question_id += 1
-
-for alg, explanation in onlogn_algorithms:
-    questions.append({
-        "id": question_id,
-        "type": "name",
-        "language": None,
-        "prompt": alg,
-        "correct_complexity": "O(n log n)",
-        "explanation": explanation,
-        "difficulty": "medium",
-        "highlight_spans": []
-    })
-    question_id += 1
-
 # === O(n²) Quadratic Questions ===
 on2_code_snippets = [
-    ("def bubble_sort(arr):\n    n = len(arr)\n    for i in range(n):\n        for j in range(n-1):\n            if arr[j] > arr[j+1]:\n                arr[j], arr[j+1] = arr[j+1], arr[j]", "Nested loops: outer n times, inner n times → O(n²)."),
-    ("def selection_sort(arr):\n    for i in range(len(arr)):\n        min_idx = i\n        for j in range(i+1, len(arr)):\n            if arr[j] < arr[min_idx]:\n                min_idx = j\n        arr[i], arr[min_idx] = arr[min_idx], arr[i]", "For each element, scan remaining array → O(n²)."),
-    ("def print_pairs(arr):\n    for i in range(len(arr)):\n        for j in range(len(arr)):\n            print(arr[i], arr[j])", "All pairs of n elements → n × n = O(n²)."),
-    ("for(int i = 0; i < n; i++) {\n    for(int j = 0; j < n; j++) {\n        matrix[i][j] = i + j;\n    }\n}", "Filling n×n matrix → O(n²)."),
-    ("def has_duplicate(arr):\n    for i in range(len(arr)):\n        for j in range(i+1, len(arr)):\n            if arr[i] == arr[j]:\n                return True\n    return False", "Comparing each pair: n(n-1)/2 comparisons → O(n²)."),
+    ("def bubble_sort(arr):\n    n = len(arr)\n    for i in range(n):\n        for j in range(n-1):\n            if arr[j] > arr[j+1]:\n                arr[j], arr[j+1] = arr[j+1], arr[j]", "Nested loops: outer n times, inner n times → O(n²).", "python"),
+    ("def selection_sort(arr):\n    for i in range(len(arr)):\n        min_idx = i\n        for j in range(i+1, len(arr)):\n            if arr[j] < arr[min_idx]:\n                min_idx = j\n        arr[i], arr[min_idx] = arr[min_idx], arr[i]", "For each element, scan remaining array → O(n²).", "python"),
+    ("def print_pairs(arr):\n    for i in range(len(arr)):\n        for j in range(len(arr)):\n            print(arr[i], arr[j])", "All pairs of n elements → n × n = O(n²).", "python"),
+    ("for(int i = 0; i < n; i++) {\n    for(int j = 0; j < n; j++) {\n        matrix[i][j] = i + j;\n    }\n}", "Filling n×n matrix → O(n²).", "cpp"),
+    ("def has_duplicate(arr):\n    for i in range(len(arr)):\n        for j in range(i+1, len(arr)):\n            if arr[i] == arr[j]:\n                return True\n    return False", "Comparing each pair: n(n-1)/2 comparisons → O(n²).", "python"),
 ]
 
 on2_algorithms = [
@@ -201,33 +151,6 @@ on2_algorithms = [
     ("Naive string matching", "For m-length pattern in n-length text, worst case O(mn) ≈ O(n²) when m≈n."),
 ]
 
-for code, explanation in on2_code_snippets:
-    lang = "cpp" if "cout" in code or "int i" in code else "python"
-    questions.append({
-        "id": question_id,
-        "type": "code",
-        "language": lang,
-        "prompt": code,
-        "correct_complexity": "O(n²)",
-        "explanation": explanation,
-        "difficulty": "easy" if question_id % 3 == 0 else "medium",
-        "highlight_spans": []
-    })
-    question_id += 1
-
-for alg, explanation in on2_algorithms:
-    questions.append({
-        "id": question_id,
-        "type": "name",
-        "language": None,
-        "prompt": alg,
-        "correct_complexity": "O(n²)",
-        "explanation": explanation,
-        "difficulty": "easy",
-        "highlight_spans": []
-    })
-    question_id += 1
-
 # === O(n³) Cubic Questions ===
 on3_code_snippets = [
     ("for i in range(n):\n    for j in range(n):\n        for k in range(n):\n            print(i, j, k)", "Three nested loops, each running n times → n×n×n = O(n³)."),
@@ -241,36 +164,10 @@ on3_algorithms = [
     ("Finding all triplets in array", "Checking all combinations of 3 elements → O(n³)."),
 ]
 
-for code, explanation in on3_code_snippets:
-    questions.append({
-        "id": question_id,
-        "type": "code",
-        "language": "python",
-        "prompt": code,
-        "correct_complexity": "O(n³)",
-        "explanation": explanation,
-        "difficulty": "medium",
-        "highlight_spans": []
-    })
-    question_id += 1
-
-for alg, explanation in on3_algorithms:
-    questions.append({
-        "id": question_id,
-        "type": "name",
-        "language": None,
-        "prompt": alg,
-        "correct_complexity": "O(n³)",
-        "explanation": explanation,
-        "difficulty": "medium",
-        "highlight_spans": []
-    })
-    question_id += 1
-
 # === O(2ⁿ) Exponential Questions ===
 o2n_code_snippets = [
     ("def fibonacci(n):\n    if n <= 1:\n        return n\n    return fibonacci(n-1) + fibonacci(n-2)", "Each call makes 2 recursive calls → binary tree of calls → O(2ⁿ)."),
-    ("def power_set(arr):\n    if len(arr) == 0:\n        return [[]]\n    elem = arr[0]\n    rest = power_set(arr[1:])\n    return rest + [subset + [elem] for subset in rest]", "Generates all 2ⁿ subsets → O(2ⁿ)."),
+    (POWER_SET, "Generates all 2ⁿ subsets → O(2ⁿ)."),
     ("def solve_n_queens(n, row=0):\n    if row == n:\n        return 1\n    count = 0\n    for col in range(n):\n        if is_safe(row, col):\n            count += solve_n_queens(n, row+1)\n    return count", "Tries all possible placements → exponential backtracking."),
 ]
 
@@ -282,35 +179,9 @@ o2n_algorithms = [
     ("Subset Sum (brute force)", "Checks all 2ⁿ subsets."),
 ]
 
-for code, explanation in o2n_code_snippets:
-    questions.append({
-        "id": question_id,
-        "type": "code",
-        "language": "python",
-        "prompt": code,
-        "correct_complexity": "O(2ⁿ)",
-        "explanation": explanation,
-        "difficulty": "hard",
-        "highlight_spans": []
-    })
-    question_id += 1
-
-for alg, explanation in o2n_algorithms:
-    questions.append({
-        "id": question_id,
-        "type": "name",
-        "language": None,
-        "prompt": alg,
-        "correct_complexity": "O(2ⁿ)",
-        "explanation": explanation,
-        "difficulty": "hard",
-        "highlight_spans": []
-    })
-    question_id += 1
-
 # === O(n!) Factorial Questions ===
 ofact_code_snippets = [
-    ("def permutations(arr):\n    if len(arr) <= 1:\n        return [arr]\n    result = []\n    for i in range(len(arr)):\n        rest = arr[:i] + arr[i+1:]\n        for perm in permutations(rest):\n            result.append([arr[i]] + perm)\n    return result", "Generates all n! permutations."),
+    (PERMUTATIONS, "Generates all n! permutations."),
     ("def traveling_salesman_brute(cities):\n    min_cost = float('inf')\n    for perm in all_permutations(cities):\n        cost = calculate_cost(perm)\n        min_cost = min(min_cost, cost)\n    return min_cost", "Tries all n! orderings of cities."),
 ]
 
@@ -320,35 +191,6 @@ ofact_algorithms = [
     ("Bogosort", "Randomly shuffles until sorted → O(n!) average."),
 ]
 
-for code, explanation in ofact_code_snippets:
-    questions.append({
-        "id": question_id,
-        "type": "code",
-        "language": "python",
-        "prompt": code,
-        "correct_complexity": "O(n!)",
-        "explanation": explanation,
-        "difficulty": "hard",
-        "highlight_spans": []
-    })
-    question_id += 1
-
-for alg, explanation in ofact_algorithms:
-    questions.append({
-        "id": question_id,
-        "type": "name",
-        "language": None,
-        "prompt": alg,
-        "correct_complexity": "O(n!)",
-        "explanation": explanation,
-        "difficulty": "hard",
-        "highlight_spans": []
-    })
-    question_id += 1
-
-# Fill remaining slots with varied mixed questions
-print(f"Generated {len(questions)} questions so far...")
-
 # Add more varied C++ questions
 cpp_questions = [
     ("vector<int> v;\nfor(int i = 0; i < n; i++) {\n    v.push_back(i);\n}", "Single loop with push_back (amortized O(1)) → O(n).", "O(n)", "easy"),
@@ -359,19 +201,6 @@ cpp_questions = [
     ("unordered_map<int, int> um;\num[key] = value;", "Hash map insertion averages O(1).", "O(1)", "easy"),
 ]
 
-for code, explanation, complexity, difficulty in cpp_questions:
-    questions.append({
-        "id": question_id,
-        "type": "code",
-        "language": "cpp",
-        "prompt": code,
-        "correct_complexity": complexity,
-        "explanation": explanation,
-        "difficulty": difficulty,
-        "highlight_spans": []
-    })
-    question_id += 1
-
 # Add more Python advanced questions
 python_advanced = [
     ("def nested_sum(matrix):\n    return sum(sum(row) for row in matrix)", "Two nested iterations over n×n matrix → O(n²).", "O(n²)", "medium"),
@@ -382,19 +211,6 @@ python_advanced = [
     ("max_val = max(arr)", "Built-in max scans all elements once → O(n).", "O(n)", "easy"),
 ]
 
-for code, explanation, complexity, difficulty in python_advanced:
-    questions.append({
-        "id": question_id,
-        "type": "code",
-        "language": "python",
-        "prompt": code,
-        "correct_complexity": complexity,
-        "explanation": explanation,
-        "difficulty": difficulty,
-        "highlight_spans": []
-    })
-    question_id += 1
-
 # Add more algorithm name questions
 more_algorithms = [
     ("DFS (Depth-First Search) on graph", "Visits each vertex and edge once → O(V + E).", "O(n)", "medium"),
@@ -409,19 +225,6 @@ more_algorithms = [
     ("Rabin-Karp Algorithm", "Rolling hash for pattern matching → O(n+m) average.", "O(n)", "medium"),
 ]
 
-for alg, explanation, complexity, difficulty in more_algorithms:
-    questions.append({
-        "id": question_id,
-        "type": "name",
-        "language": None,
-        "prompt": alg,
-        "correct_complexity": complexity,
-        "explanation": explanation,
-        "difficulty": difficulty,
-        "highlight_spans": []
-    })
-    question_id += 1
-
 # Add more mixed complexity questions
 mixed_questions = [
     ("def mystery1(n):\n    result = 0\n    i = 1\n    while i < n:\n        result += i\n        i *= 2\n    return result", "Loop with i *= 2 → O(log n).", "O(log n)", "medium", "python"),
@@ -431,50 +234,158 @@ mixed_questions = [
     ("def tower_hanoi(n):\n    if n == 1:\n        return 1\n    return 2 * tower_hanoi(n-1) + 1", "T(n) = 2T(n-1) + 1 → O(2ⁿ).", "O(2ⁿ)", "hard", "python"),
 ]
 
-for code, explanation, complexity, difficulty, lang in mixed_questions:
-    questions.append({
-        "id": question_id,
-        "type": "code",
-        "language": lang,
-        "prompt": code,
-        "correct_complexity": complexity,
-        "explanation": explanation,
-        "difficulty": difficulty,
-        "highlight_spans": []
-    })
-    question_id += 1
-
 # Pad with more easy questions if needed
-while len(questions) < 200:
-    easy_fillers = [
-        ("return len(arr)", "Getting length is O(1).", "O(1)", "easy", "python"),
-        ("x = arr[index]", "Array indexing is O(1).", "O(1)", "easy", "python"),
-        ("arr.clear()", "Clearing list is O(n).", "O(n)", "easy", "python"),
-        ("'substring' in string", "String search is O(n*m) worst case → O(n) typically.", "O(n)", "easy", "python"),
-        ("for i in range(n):\n    arr.append(i)", "n append operations (amortized O(1) each) → O(n).", "O(n)", "easy", "python"),
-    ]
-    code, explanation, complexity, difficulty, lang = easy_fillers[len(questions) % len(easy_fillers)]
-    questions.append({
-        "id": question_id,
-        "type": "code",
-        "language": lang,
-        "prompt": code,
-        "correct_complexity": complexity,
-        "explanation": explanation,
-        "difficulty": difficulty,
-        "highlight_spans": []
-    })
-    question_id += 1
-
-# Save to JSON
-output = {"questions": questions[:200]}  # Cap at 200
-with open('quiz_bank.json', 'w', encoding='utf-8') as f:
-    json.dump(output, f, indent=2)
-
-print(f"[OK] Generated {len(output['questions'])} questions")
-print(f"Breakdown:")
-print(f"  Easy: {sum(1 for q in output['questions'] if q['difficulty'] == 'easy')}")
-print(f"  Medium: {sum(1 for q in output['questions'] if q['difficulty'] == 'medium')}")
-print(f"  Hard: {sum(1 for q in output['questions'] if q['difficulty'] == 'hard')}")
-print(f"  Code: {sum(1 for q in output['questions'] if q['type'] == 'code')}")
-print(f"  Algorithm names: {sum(1 for q in output['questions'] if q['type'] == 'name')}")
+easy_fillers = [
+    ("return len(arr)", "Getting length is O(1).", "O(1)", "easy", "python"),
+    ("x = arr[index]", "Array indexing is O(1).", "O(1)", "easy", "python"),
+    ("arr.clear()", "Clearing list is O(n).", "O(n)", "easy", "python"),
+    ("'substring' in string", "String search is O(n*m) worst case → O(n) typically.", "O(n)", "easy", "python"),
+    ("for i in range(n):\n    arr.append(i)", "n append operations (amortized O(1) each) → O(n).", "O(n)", "easy", "python"),
+]
+
+
+def every_nth_easy(n):
+    """Difficulty that is "easy" on every n-th question id and "medium" otherwise."""
+    return lambda qid: "easy" if qid % n == 0 else "medium"
+
+
+# Marks a section default that every row in the section must supply
+PER_ROW = object()
+
+# Row shapes: the fields each item tuple in a section holds, in order
+PLAIN = ("prompt", "explanation")
+WITH_LANGUAGE = PLAIN + ("language",)
+GRADED = PLAIN + ("complexity", "difficulty")
+GRADED_WITH_LANGUAGE = GRADED + ("language",)
+SHAPES = (PLAIN, WITH_LANGUAGE, GRADED, GRADED_WITH_LANGUAGE)
+
+# Each section: (complexity, type, language, difficulty, shape, items).
+# Every item must match the section's shape; its fields override the
+# section defaults, and a PER_ROW default must be supplied by the shape.
+SECTIONS = [
+    ("O(1)", "code", "python", "easy", PLAIN, o1_code_snippets),
+    ("O(1)", "name", None, "easy", PLAIN, o1_algorithms),
+    ("O(log n)", "code", PER_ROW, every_nth_easy(2), WITH_LANGUAGE, ologn_code_snippets),
+    ("O(log n)", "name", None, "easy", PLAIN, ologn_algorithms),
+    ("O(n)", "code", "python", "easy", PLAIN, on_code_snippets),
+    ("O(n)", "name", None, "easy", PLAIN, on_algorithms),
+    ("O(n log n)", "code", "python", "medium", PLAIN, onlogn_code_snippets),
+    ("O(n log n)", "name", None, "medium", PLAIN, onlogn_algorithms),
+    ("O(n²)", "code", PER_ROW, every_nth_easy(3), WITH_LANGUAGE, on2_code_snippets),
+    ("O(n²)", "name", None, "easy", PLAIN, on2_algorithms),
+    ("O(n³)", "code", "python", "medium", PLAIN, on3_code_snippets),
+    ("O(n³)", "name", None, "medium", PLAIN, on3_algorithms),
+    ("O(2ⁿ)", "code", "python", "hard", PLAIN, o2n_code_snippets),
+    ("O(2ⁿ)", "name", None, "hard", PLAIN, o2n_algorithms),
+    ("O(n!)", "code", "python", "hard", PLAIN, ofact_code_snippets),
+    ("O(n!)", "name", None, "hard", PLAIN, ofact_algorithms),
+    (PER_ROW, "code", "cpp", PER_ROW, GRADED, cpp_questions),
+    (PER_ROW, "code", "python", PER_ROW, GRADED, python_advanced),
+    (PER_ROW, "name", None, PER_ROW, GRADED, more_algorithms),
+    (PER_ROW, "code", PER_ROW, PER_ROW, GRADED_WITH_LANGUAGE, mixed_questions),
+]
+
+QUIZ_BANK_PATH = Path(__file__).with_name('quiz_bank.json')
+
+
+# Shared empty highlight_spans; serializes as [] and is never mutated
+_NO_SPANS = ()
+
+
+@dataclass(slots=True)
+class Question:
+    id: int
+    type: str
+    language: str | None
+    prompt: str
+    correct_complexity: str
+    explanation: str
+    difficulty: str
+    highlight_spans: tuple = _NO_SPANS
+
+
+def make_q(qid, qtype, item, shape, complexity, language, difficulty):
+    if len(item) != len(shape):
+        raise ValueError(f"expected a {len(shape)}-field row {shape}, got {item!r}")
+    if shape is PLAIN:
+        prompt, explanation = item
+    elif shape is WITH_LANGUAGE:
+        prompt, explanation, language = item
+    elif shape is GRADED:
+        prompt, explanation, complexity, difficulty = item
+    else:
+        prompt, explanation, complexity, difficulty, language = item
+    if callable(difficulty):
+        difficulty = difficulty(qid)
+    return Question(qid, qtype, language, prompt, complexity, explanation, difficulty)
+
+
+def padded_sections():
+    """Return SECTIONS plus a filler section padding the bank out to 200.
+
+    Fillers continue their rotation from the number of authored questions.
+    Raises ValueError if the authored sections alone exceed 200 questions.
+    """
+    generated = sum(len(items) for *_, items in SECTIONS)
+    if generated > 200:
+        raise ValueError(f"{generated} authored questions exceed the 200-question bank")
+    offset = generated % len(easy_fillers)
+    fillers = itertools.islice(itertools.cycle(easy_fillers), offset, offset + 200 - generated)
+    return [*SECTIONS, (PER_ROW, "code", PER_ROW, PER_ROW, GRADED_WITH_LANGUAGE, fillers)]
+
+
+def gen_questions(sections):
+    qid = itertools.count(1)
+    for complexity, qtype, language, difficulty, shape, items in sections:
+        if all(shape is not known for known in SHAPES):
+            raise ValueError(f"unknown row shape {shape}")
+        defaults = (("complexity", complexity), ("language", language), ("difficulty", difficulty))
+        missing = [name for name, value in defaults if value is PER_ROW and name not in shape]
+        if missing:
+            raise ValueError(f"rows of shape {shape} do not supply {', '.join(missing)}")
+        for item in items:
+            yield make_q(next(qid), qtype, item, shape, complexity, language, difficulty)
+
+
+def write_stream(path, iter_questions):
+    """Write questions to ``path`` one record at a time.
+
+    The records are streamed into a sibling temp file that only replaces
+    ``path`` once complete, so a failure never leaves a truncated bank.
+    Returns Counters of the written questions by difficulty and by type.
+    """
+    c_diff, c_type = Counter(), Counter()
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb', buffering=1 << 20) as f:
+            f.write(b'{"questions":[\n')
+            for i, q in enumerate(iter_questions):
+                if i:
+                    f.write(b',\n')
+                f.write(dumps(q))
+                c_diff[q.difficulty] += 1
+                c_type[q.type] += 1
+            f.write(b'\n]}\n')
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return c_diff, c_type
+
+
+def main():
+    # Size the bank before write_stream() opens anything
+    sections = padded_sections()
+    c_diff, c_type = write_stream(QUIZ_BANK_PATH, gen_questions(sections))
+
+    print(f"[OK] Generated {c_type.total()} questions")
+    print(f"Breakdown:")
+    print(f"  Easy: {c_diff['easy']}")
+    print(f"  Medium: {c_diff['medium']}")
+    print(f"  Hard: {c_diff['hard']}")
+    print(f"  Code: {c_type['code']}")
+    print(f"  Algorithm names: {c_type['name']}")
+
+
+if __name__ == "__main__":
+    main()